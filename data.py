@@ -0,0 +1,81 @@
+#  SHARED DATA LOADER (used by every page of the app)
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+CSV_PATH = "global_street_food_cleaned.csv"          # raw source
+DATA_PATH = "global_street_food_cleaned.parquet"     # cleaned + typed, what the app reads
+
+# Dataset names that pycountry can't resolve on its own
+ISO3_OVERRIDES = {"Turkey": "TUR"}
+
+def to_iso3(name):
+    """ISO-3 code for a country name, or None if it can't be resolved."""
+    import pycountry    # only needed when rebuilding the Parquet file
+    if name in ISO3_OVERRIDES:
+        return ISO3_OVERRIDES[name]
+    try:
+        return pycountry.countries.lookup(name).alpha_3
+    except LookupError:
+        return None
+
+#----------------------- CLEAN -------------------------#
+def clean(df):
+    """Apply the dashboard's cleaning steps to the raw CSV table."""
+
+    # Fix typo
+    df["Country"] = df["Country"].str.replace("Leba0n", "Lebanon")
+
+    # Remove accidental spaces in column headers
+    df.columns = df.columns.str.strip()
+
+    # Make price numeric (float32 halves the bytes every aggregation reads)
+    df["TypicalPrice(USD)"] = pd.to_numeric(df["TypicalPrice(USD)"], errors="coerce",
+                                            downcast="float")
+
+    # How many ingredients does each dish list? (commas + 1, no list building)
+    if "Ingredients" in df.columns:
+        df["IngredientCount"] = df["Ingredients"].str.count(",") + 1
+    else:
+        # Fallback: use length of Description words if Ingredients column absent
+        df["IngredientCount"] = df["Description"].str.strip().str.count(r"\s+") + 1
+
+    # Clean up NULLS (only in the columns the dashboard actually uses)
+    df = df.dropna(subset=["Country", "Region/City", "TypicalPrice(USD)",
+                           "Vegetarian", "CookingMethod", "IngredientCount"])
+    df["IngredientCount"] = df["IngredientCount"].astype(np.int16)
+    df["Vegetarian"] = df["Vegetarian"].astype(np.int8)
+
+    # Low-cardinality text columns -> categorical (int codes for groupby/filter)
+    for col in ["Country", "Region/City", "CookingMethod"]:
+        df[col] = df[col].astype("category")
+
+    # ISO-3 codes for the choropleth (mapped once per category, not per row)
+    df["ISO3"] = df["Country"].map(to_iso3)
+
+    # Veg flag -> labelled dish type, built straight from the 0/1 codes
+    df["DishType"] = pd.Categorical.from_codes(df["Vegetarian"].values,
+                                               categories=["Non-Vegetarian", "Vegetarian"])
+    return df
+
+
+def build_parquet(csv_path=CSV_PATH, parquet_path=DATA_PATH):
+    """Regenerate the Parquet file from the CSV (run ``python data.py``)."""
+    df = clean(pd.read_csv(csv_path))
+
+    # An unresolved country would silently vanish from the ISO-3 choropleth
+    unresolved = sorted(df.loc[df["ISO3"].isna(), "Country"].astype(str).unique())
+    if unresolved:
+        raise ValueError(f"No ISO-3 code for {unresolved}; add them to ISO3_OVERRIDES")
+
+    df.to_parquet(parquet_path, engine="pyarrow", index=False)
+
+#----------------------- DATA LOAD -------------------------#
+@st.cache_data
+def get_df(path=DATA_PATH):
+    """Load the cleaned, typed street-food table (cached across reruns and pages)."""
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+if __name__ == "__main__":
+    build_parquet()
@@ -1,11 +1,11 @@
 import streamlit as st
-import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 import plotly.express as px
+from data import get_df
 
-# Load your data
-df = pd.read_csv("global_street_food_cleaned.csv")
+# Load your data (shared cache with Dashboard.py)
+df = get_df()
 
 st.title("📊 Interactive vs Static Charts Demo")
 
@@ -15,7 +15,11 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("Seaborn (Static)")
     fig1, ax = plt.subplots()
-    sns.barplot(x="Country", y="TypicalPrice(USD)", data=df, ax=ax)
+    # Pre-aggregate: seaborn would otherwise bootstrap a CI for every country
+    avg_price = (df.groupby("Country", observed=True)["TypicalPrice(USD)"]
+                 .mean()
+                 .reset_index())
+    sns.barplot(x="Country", y="TypicalPrice(USD)", data=avg_price, ax=ax)
     plt.xticks(rotation=90)
     st.pyplot(fig1)
 
@@ -28,10 +32,9 @@ with col2:
 
     import seaborn as sns
 import matplotlib.pyplot as plt
-import pandas as pd
 import streamlit as st
 
-df = pd.read_csv("global_street_food_cleaned.csv")
+df = get_df()
 
 st.subheader("🎻 Violin Plot: Price Distribution by Region")
 